@@ -6,6 +6,7 @@ of the question selector.
 """
 
 import os
+import re
 
 # AP Calculus AB Chapter/Topic Mapping (Based on College Board Course Framework)
 AP_CALCULUS_AB_CHAPTERS = {
@@ -25,6 +26,13 @@ AP_CALCULUS_BC_ADDITIONAL = {
     "10": "Infinite Sequences and Series"
 }
 
+# Each course's chapters (BC includes all of AB) in chapter order
+COURSE_CHAPTERS = {
+    "AB": dict(sorted(AP_CALCULUS_AB_CHAPTERS.items(), key=lambda item: int(item[0]))),
+    "BC": dict(sorted({**AP_CALCULUS_AB_CHAPTERS, **AP_CALCULUS_BC_ADDITIONAL}.items(),
+                      key=lambda item: int(item[0])))
+}
+
 # Topic keywords for identifying questions (simplified mapping)
 TOPIC_KEYWORDS = {
     "1": ["limit", "continuity", "asymptote", "discontinuity", "intermediate value"],
@@ -39,28 +47,40 @@ TOPIC_KEYWORDS = {
     "10": ["series", "sequence", "convergence", "divergence", "taylor", "maclaurin"]
 }
 
+# Directory for cached question extraction results (see QuestionExtractor),
+# following the XDG convention of ~/.cache unless XDG_CACHE_HOME is set
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "apcalc"
+)
+
+# Test bank file names, e.g. TB_3.pdf
+_TEST_BANK_RE = re.compile(r'TB_(\d+)\.pdf')
+
 
 def get_available_test_banks(pdf_dir: str = ".") -> list:
     """
     Get list of available test bank PDF files.
     
-    Note: TB_2.pdf is not included in the repository. The available test banks
-    are TB_1.pdf, TB_3.pdf, TB_4.pdf, TB_5.pdf, TB_6.pdf, and TB_7.pdf.
+    Any file named TB_<number>.pdf in the directory is picked up. Note: TB_2.pdf
+    is not included in the repository. The available test banks are TB_1.pdf,
+    TB_3.pdf, TB_4.pdf, TB_5.pdf, TB_6.pdf, and TB_7.pdf.
     
     Args:
         pdf_dir: Directory containing the PDF files
         
     Returns:
-        List of available test bank filenames
+        List of available test bank filenames, in test bank number order
     """
-    # Expected test bank files (TB_2.pdf is missing from the repository)
-    expected_files = [f"TB_{i}.pdf" for i in [1, 3, 4, 5, 6, 7]]
-    
-    # Filter to only include files that actually exist
-    available = []
-    for filename in expected_files:
-        filepath = os.path.join(pdf_dir, filename)
-        if os.path.exists(filepath):
-            available.append(filename)
+    # A single directory scan; DirEntry.is_file() normally needs no extra stat
+    test_banks = []
+    try:
+        with os.scandir(pdf_dir) as entries:
+            for entry in entries:
+                match = _TEST_BANK_RE.fullmatch(entry.name)
+                if match and entry.is_file():
+                    test_banks.append((int(match.group(1)), entry.name))
+    except OSError:
+        return []
     
-    return available
+    return [name for _, name in sorted(test_banks)]
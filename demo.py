@@ -8,6 +8,7 @@ with various example scenarios.
 
 from question_selector_cli import QuestionExtractor
 from config import AP_CALCULUS_AB_CHAPTERS, AP_CALCULUS_BC_ADDITIONAL
+import logging
 import time
 
 
@@ -18,11 +19,10 @@ def print_section(title):
     print("=" * 80)
 
 
-def demo_basic_search():
+def demo_basic_search(extractor):
     """Demonstrate basic search functionality."""
     print_section("DEMO 1: Basic Search - Chapters 1-4")
     
-    extractor = QuestionExtractor()
     selected_chapters = ['1', '2', '3', '4']
     
     print("\nSearching for questions covering:")
@@ -44,11 +44,10 @@ def demo_basic_search():
         print()
 
 
-def demo_single_chapter():
+def demo_single_chapter(extractor):
     """Demonstrate single chapter search."""
     print_section("DEMO 2: Single Chapter Search - Chapter 5")
     
-    extractor = QuestionExtractor()
     selected_chapters = ['5']
     
     print("\nSearching for questions covering:")
@@ -69,11 +68,10 @@ def demo_single_chapter():
         print()
 
 
-def demo_all_ab_chapters():
+def demo_all_ab_chapters(extractor):
     """Demonstrate searching all AB chapters."""
     print_section("DEMO 3: All AP Calculus AB Chapters")
     
-    extractor = QuestionExtractor()
     selected_chapters = list(AP_CALCULUS_AB_CHAPTERS.keys())
     
     print("\nSearching across ALL AP Calculus AB chapters:")
@@ -99,11 +97,10 @@ def demo_all_ab_chapters():
     print()
 
 
-def demo_bc_topics():
+def demo_bc_topics(extractor):
     """Demonstrate BC-specific topics."""
     print_section("DEMO 4: AP Calculus BC Specific Topics")
     
-    extractor = QuestionExtractor()
     bc_chapters = list(AP_CALCULUS_BC_ADDITIONAL.keys())
     
     print("\nSearching for BC-specific topics:")
@@ -128,12 +125,10 @@ def demo_bc_topics():
         print("This may indicate limited BC content in current test banks.")
 
 
-def demo_statistics():
+def demo_statistics(extractor):
     """Show statistics about the test bank."""
     print_section("DEMO 5: Test Bank Statistics")
     
-    extractor = QuestionExtractor()
-    
     print("\nAnalyzing available test banks...")
     print(f"Test banks: {', '.join(extractor.test_banks)}")
     print("\nNote: TB_2.pdf is not included in the repository.")
@@ -141,8 +136,7 @@ def demo_statistics():
     # Use a lighter approach - just count questions per file
     total = 0
     for tb_file in extractor.test_banks:
-        questions = extractor.extract_questions_from_pdf(tb_file)
-        count = len(questions)
+        count = extractor.count_questions(tb_file)
         total += count
         print(f"  {tb_file}: {count} questions")
     
@@ -156,20 +150,27 @@ def main():
     print("\nThis demo shows various ways to use the question selector.\n")
     input("Press Enter to continue...")
     
+    # Show the extractor's progress while the test banks are read, as the CLI's -v does
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
+    # Parse the test banks once and share them across all demos
+    extractor = QuestionExtractor()
+    extractor.load_all()
+    
     # Run demos
-    demo_basic_search()
+    demo_basic_search(extractor)
     input("\nPress Enter for next demo...")
     
-    demo_single_chapter()
+    demo_single_chapter(extractor)
     input("\nPress Enter for next demo...")
     
-    demo_all_ab_chapters()
+    demo_all_ab_chapters(extractor)
     input("\nPress Enter for next demo...")
     
-    demo_bc_topics()
+    demo_bc_topics(extractor)
     input("\nPress Enter for next demo...")
     
-    demo_statistics()
+    demo_statistics(extractor)
     
     print_section("DEMONSTRATION COMPLETE")
     print("\nTo use the interactive question selector, run:")
@@ -8,111 +8,9 @@ matching specific College Board AP Calculus AB or BC chapters.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import PyPDF2
-import os
-import re
-from typing import List, Dict, Tuple
 
-from config import (
-    AP_CALCULUS_AB_CHAPTERS,
-    AP_CALCULUS_BC_ADDITIONAL,
-    TOPIC_KEYWORDS,
-    get_available_test_banks
-)
-
-
-class QuestionExtractor:
-    """Extracts questions from PDF test banks."""
-    
-    def __init__(self, pdf_dir: str = "."):
-        self.pdf_dir = pdf_dir
-        self.test_banks = get_available_test_banks(pdf_dir)
-    
-    def extract_questions_from_pdf(self, filename: str) -> List[Dict]:
-        """Extract all questions from a PDF file."""
-        questions = []
-        filepath = os.path.join(self.pdf_dir, filename)
-        
-        if not os.path.exists(filepath):
-            return questions
-        
-        try:
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    text = pdf_reader.pages[page_num].extract_text()
-                    
-                    # Split into individual questions (questions typically start with a number followed by a period)
-                    # This is a simplified approach
-                    question_blocks = self._split_into_questions(text)
-                    
-                    for block in question_blocks:
-                        questions.append({
-                            'source': filename,
-                            'page': page_num + 1,
-                            'text': block,
-                            'topics': self._identify_topics(block)
-                        })
-        except Exception as e:
-            print(f"Error reading {filename}: {e}")
-        
-        return questions
-    
-    def _split_into_questions(self, text: str) -> List[str]:
-        """Split page text into individual questions."""
-        # Simple approach: split by question numbers (1., 2., etc.)
-        # This is a heuristic and may need refinement
-        lines = text.split('\n')
-        questions = []
-        current_question = []
-        
-        for line in lines:
-            # Check if line starts with a question number
-            if re.match(r'^\s*\d+\.\s+', line.strip()):
-                if current_question:
-                    questions.append('\n'.join(current_question))
-                current_question = [line]
-            elif current_question:
-                current_question.append(line)
-        
-        if current_question:
-            questions.append('\n'.join(current_question))
-        
-        return questions
-    
-    def _identify_topics(self, question_text: str) -> List[str]:
-        """Identify which topics/chapters a question relates to based on keywords."""
-        topics = []
-        text_lower = question_text.lower()
-        
-        for topic_num, keywords in TOPIC_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    topics.append(topic_num)
-                    break
-        
-        return list(set(topics))  # Remove duplicates
-    
-    def get_questions_by_topics(self, selected_topics: List[str], max_questions: int = None) -> List[Dict]:
-        """Get questions that match the selected topics."""
-        all_questions = []
-        
-        for tb_file in self.test_banks:
-            questions = self.extract_questions_from_pdf(tb_file)
-            all_questions.extend(questions)
-        
-        # Filter questions that match any of the selected topics
-        matching_questions = []
-        for question in all_questions:
-            if any(topic in question['topics'] for topic in selected_topics):
-                matching_questions.append(question)
-        
-        # Limit to max_questions if specified
-        if max_questions and max_questions > 0:
-            matching_questions = matching_questions[:max_questions]
-        
-        return matching_questions
+from config import COURSE_CHAPTERS
+from question_selector_cli import QuestionExtractor
 
 
 class QuestionSelectorGUI:
@@ -203,12 +101,7 @@ class QuestionSelectorGUI:
         """Update the chapter list based on selected course."""
         self.chapter_listbox.delete(0, tk.END)
         
-        chapters = AP_CALCULUS_AB_CHAPTERS.copy()
-        if self.course_var.get() == "BC":
-            chapters.update(AP_CALCULUS_BC_ADDITIONAL)
-        
-        for chapter_num in sorted(chapters.keys(), key=int):
-            chapter_name = chapters[chapter_num]
+        for chapter_num, chapter_name in COURSE_CHAPTERS[self.course_var.get()].items():
             self.chapter_listbox.insert(tk.END, f"Chapter {chapter_num}: {chapter_name}")
     
     def search_questions(self):
@@ -6,115 +6,471 @@ This program allows users to select a subset of questions from AP Calculus test
 matching specific College Board AP Calculus AB or BC chapters via command line.
 """
 
-import PyPDF2
+import argparse
+import hashlib
+import heapq
+import logging
 import os
+import pickle
 import re
-from typing import List, Dict
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Iterator, List, Dict, Optional, Tuple
+
+try:
+    import acora
+except ImportError:
+    acora = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
 from config import (
-    AP_CALCULUS_AB_CHAPTERS,
-    AP_CALCULUS_BC_ADDITIONAL,
+    COURSE_CHAPTERS,
     TOPIC_KEYWORDS,
+    CACHE_DIR,
     get_available_test_banks
 )
 
+logger = logging.getLogger(__name__)
+
+# Reverse lookup from each keyword to the chapter it identifies. Keywords are
+# lowercased once here so matching stays case-insensitive even if TOPIC_KEYWORDS
+# is edited to include capitals.
+_KEYWORD_TO_TOPIC = {
+    keyword.lower(): topic_num
+    for topic_num, keywords in TOPIC_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# One case-insensitive alternation per topic. search() stops at the first
+# keyword found, so each topic costs at most one scan of the text.
+_TOPIC_PATTERNS = {
+    topic_num: re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords), re.IGNORECASE)
+    for topic_num, keywords in TOPIC_KEYWORDS.items()
+}
+
+# A line that starts a new question, e.g. "12. Find the limit..."
+_QUESTION_START_RE = re.compile(r'^[^\S\n]*\d+\.[^\S\n]+\S', re.MULTILINE)
+
+
+def _build_keyword_matcher():
+    """
+    Build a matcher over every topic keyword.
+    
+    Returns (matcher, wants_lowercase). The matcher yields the topic of the
+    keywords found in a text. With acora or pyahocorasick installed this is a
+    single Aho-Corasick pass; otherwise each topic's precompiled pattern is
+    searched up to its first hit. wants_lowercase is True when the matcher is
+    case-sensitive (pyahocorasick) and must be given lowercased text.
+    """
+    if acora is not None:
+        matcher = acora.AcoraBuilder(*_KEYWORD_TO_TOPIC).build(ignore_case=True)
+        def topics(text):
+            return (_KEYWORD_TO_TOPIC[keyword.lower()] for keyword, _ in matcher.findall(text))
+        return topics, False
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword, topic_num in _KEYWORD_TO_TOPIC.items():
+            automaton.add_word(keyword, topic_num)
+        automaton.make_automaton()
+        return (lambda text: (topic_num for _, topic_num in automaton.iter(text))), True
+    
+    def topics(text):
+        return (topic_num for topic_num, pattern in _TOPIC_PATTERNS.items() if pattern.search(text))
+    return topics, False
+
+
+# Built once at import and shared by every QuestionExtractor
+_KEYWORD_MATCHER, _MATCHER_WANTS_LOWERCASE = _build_keyword_matcher()
+
+# A chapter selection such as "1, 3, 5-7", and each number or range within it
+_SELECTION_RE = re.compile(r'\s*\d+(?:\s*-\s*\d+)?(?:\s*,\s*\d+(?:\s*-\s*\d+)?)*\s*')
+_SELECTION_PART_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+# Bumped whenever the format of cached questions changes, so stale cache
+# files are ignored. 2: topics are sorted, interned tuples.
+_CACHE_VERSION = 2
+
+# Everything besides the PDF itself that shapes a cached question: the
+# keywords its topics come from, the text extraction backend and the
+# question splitter. Part of each cache file's name, so editing any of them
+# makes earlier cache files miss instead of returning stale questions.
+_CACHE_SALT = hashlib.blake2b(repr((
+    sorted(_KEYWORD_TO_TOPIC.items()),
+    "pdfium" if pdfium is not None else "PyPDF2",
+    _QUESTION_START_RE.pattern,
+)).encode(), digest_size=16).hexdigest()
+
+# Canonical topics tuple for each combination of topics found in a question
+_TOPIC_TUPLES: Dict[frozenset, Tuple[str, ...]] = {}
+
+
+def _intern_topics(questions: List[Dict]):
+    """
+    Replace each question's topics with the canonical tuple for its topics.
+    
+    Questions unpickled from the disk cache or a worker process come with
+    their own tuples, shared only within one file.
+    """
+    for question in questions:
+        topics = question['topics']
+        question['topics'] = _TOPIC_TUPLES.setdefault(frozenset(topics), topics)
+
 
 class QuestionExtractor:
     """Extracts questions from PDF test banks."""
     
+    # Parsed questions shared by all instances, keyed like the on-disk cache
+    _pdf_cache = {}
+    
     def __init__(self, pdf_dir: str = "."):
         self.pdf_dir = pdf_dir
         self.test_banks = get_available_test_banks(pdf_dir)
+        self._all_questions = None
+        self._topic_index = {}
     
     def extract_questions_from_pdf(self, filename: str) -> List[Dict]:
-        """Extract all questions from a PDF file."""
-        questions = []
+        """
+        Extract all questions from a PDF file.
+        
+        Results are cached in memory and on disk, keyed by the file's path,
+        modification time and size, so an unchanged PDF is only parsed once.
+        """
+        return list(self._iter_questions(filename))
+    
+    def _iter_questions(self, filename: str) -> Iterator[Dict]:
+        """
+        Yield the questions of a PDF file.
+        
+        Cached questions are used when available. Otherwise questions are
+        yielded as the PDF is parsed, and cached once the whole file is read.
+        """
         filepath = os.path.join(self.pdf_dir, filename)
         
-        if not os.path.exists(filepath):
-            return questions
+        try:
+            key = self._cache_key(filepath)
+        except FileNotFoundError:
+            return
+        
+        questions = self._load_cached(key)
+        if questions is not None:
+            yield from questions
+            return
         
+        questions = []
         try:
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    text = pdf_reader.pages[page_num].extract_text()
-                    
-                    # Split into individual questions
-                    question_blocks = self._split_into_questions(text)
-                    
-                    for block in question_blocks:
-                        questions.append({
-                            'source': filename,
-                            'page': page_num + 1,
-                            'text': block,
-                            'topics': self._identify_topics(block)
-                        })
+            for question in self._iter_pdf_questions(filepath, filename):
+                questions.append(question)
+                yield question
         except Exception as e:
-            print(f"Error reading {filename}: {e}")
+            # Don't cache a partially read file
+            logger.error("Error reading %s: %s", filename, e)
+            return
+        
+        # Write to a temporary file and move it into place, so an interrupted
+        # run or two runs caching the same file never leave a partial pickle
+        tmp_path = None
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=CACHE_DIR)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(questions, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path(key))
+        except OSError:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
         
+        self._pdf_cache[key] = questions
+    
+    def _load_cached(self, key: Tuple) -> Optional[List[Dict]]:
+        """Return a PDF's cached questions from memory or disk, or None if it isn't cached."""
+        if key in self._pdf_cache:
+            return self._pdf_cache[key]
+        
+        cache_path = self._cache_path(key)
+        try:
+            with open(cache_path, 'rb') as f:
+                questions = pickle.load(f)
+            if not isinstance(questions, list):
+                raise TypeError(f"expected a list, got {type(questions).__name__}")
+            _intern_topics(questions)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # The cache only saves time: treat a damaged or unreadable file as
+            # a miss, and remove it so the PDF's questions are cached again
+            logger.debug("Ignoring cache file %s: %s", cache_path, e)
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            return None
+        
+        self._pdf_cache[key] = questions
         return questions
     
-    def _split_into_questions(self, text: str) -> List[str]:
-        """Split page text into individual questions."""
-        lines = text.split('\n')
-        questions = []
-        current_question = []
+    def count_questions(self, filename: str) -> int:
+        """
+        Count the questions in a PDF file.
         
-        for line in lines:
-            # Check if line starts with a question number
-            if re.match(r'^\s*\d+\.\s+', line.strip()):
-                if current_question:
-                    questions.append('\n'.join(current_question))
-                current_question = [line]
-            elif current_question:
-                current_question.append(line)
+        Uses already extracted questions (in memory or on disk) when available,
+        otherwise only counts question numbers in the page text without
+        building question records.
+        """
+        filepath = os.path.join(self.pdf_dir, filename)
         
-        if current_question:
-            questions.append('\n'.join(current_question))
+        try:
+            key = self._cache_key(filepath)
+        except FileNotFoundError:
+            return 0
         
-        return questions
+        questions = self._load_cached(key)
+        if questions is not None:
+            return len(questions)
+        
+        count = 0
+        try:
+            for _, text in self._iter_page_texts(filepath):
+                count += len(_QUESTION_START_RE.findall(text))
+        except Exception as e:
+            logger.error("Error reading %s: %s", filename, e)
+        
+        return count
+    
+    @staticmethod
+    def _cache_key(filepath: str) -> Tuple:
+        """Identify a version of a PDF file by its path, modification time and size."""
+        stat = os.stat(filepath)
+        return (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+    
+    @staticmethod
+    def _cache_path(key: Tuple) -> str:
+        """Path of the on-disk cache file for a PDF's cache key."""
+        key_text = "|".join(map(str, (_CACHE_VERSION, _CACHE_SALT) + key))
+        cache_name = hashlib.blake2b(key_text.encode(), digest_size=16).hexdigest()
+        return os.path.join(CACHE_DIR, cache_name + ".pkl")
     
-    def _identify_topics(self, question_text: str) -> List[str]:
-        """Identify which topics/chapters a question relates to based on keywords."""
-        topics = []
-        text_lower = question_text.lower()
+    @staticmethod
+    def _iter_page_texts(filepath: str):
+        """
+        Yield the (1-based page number, text) of each page in a PDF file.
         
-        for topic_num, keywords in TOPIC_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    topics.append(topic_num)
-                    break
+        Text is extracted with pypdfium2 (PDFium) when it is installed, and
+        with the slower pure-Python PyPDF2 otherwise. Pages are read one after
+        another: PDFium is not thread-safe, even across separate documents,
+        so parallelism is only ever across test banks in separate processes.
+        """
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(filepath)
+            try:
+                for page_num, page in enumerate(pdf, start=1):
+                    textpage = page.get_textpage()
+                    try:
+                        # PDFium ends lines with \r\n; PyPDF2 and the question splitter use \n
+                        yield page_num, textpage.get_text_range().replace('\r\n', '\n')
+                    finally:
+                        textpage.close()
+                        page.close()
+            finally:
+                pdf.close()
+            return
         
-        return list(set(topics))  # Remove duplicates
+        # Imported here so starting the CLI doesn't pay for loading PyPDF2
+        import PyPDF2
+        
+        with open(filepath, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file, strict=False)
+            
+            for page_num, page in enumerate(pdf_reader.pages, start=1):
+                yield page_num, page.extract_text()
     
-    def get_questions_by_topics(self, selected_topics: List[str], max_questions: int = None) -> List[Dict]:
-        """Get questions that match the selected topics."""
-        all_questions = []
+    def _extract_in_parallel(self, filenames: List[str]):
+        """
+        Parse the given test banks that aren't cached yet in worker processes.
+        
+        Files cached in memory or on disk are skipped, since loading those
+        directly is faster than passing them through a worker. If worker
+        processes can't be used, the files are left for the caller to read
+        one by one.
+        """
+        pending = {}
+        for filename in filenames:
+            try:
+                key = self._cache_key(os.path.join(self.pdf_dir, filename))
+            except FileNotFoundError:
+                continue
+            if key not in self._pdf_cache and not os.path.exists(self._cache_path(key)):
+                pending[filename] = key
+        
+        # Not worth starting a pool for a single file or a single worker
+        workers = min(len(pending), os.cpu_count() or 1)
+        if workers < 2:
+            return
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for filename, questions in executor.map(_extract_test_bank, repeat(self.pdf_dir), pending):
+                    # Failed files are left for load_all to read (and report) again
+                    if questions is not None:
+                        _intern_topics(questions)
+                        self._pdf_cache[pending[filename]] = questions
+        except (OSError, ImportError, BrokenProcessPool) as e:
+            # e.g. a sandbox without working multiprocessing
+            logger.warning("Could not read test banks in parallel (%s); reading them one by one", e)
+    
+    def _iter_pdf_questions(self, filepath: str, filename: str):
+        """Parse a PDF file and yield its questions."""
+        for page_num, text in self._iter_page_texts(filepath):
+            # A case-sensitive matcher needs lowercase text, so lowercase the
+            # page once and classify slices of it rather than lowercasing every
+            # question. Slicing is only valid if lowercasing kept every offset.
+            text_lower = None
+            if _MATCHER_WANTS_LOWERCASE:
+                text_lower = text.lower()
+                if len(text_lower) != len(text):
+                    text_lower = None
+            
+            # Split into individual questions
+            for start, end in self._question_spans(text):
+                if text_lower is not None:
+                    topics = self._identify_topics(text_lower[start:end], is_lowercase=True)
+                else:
+                    topics = self._identify_topics(text[start:end])
+                
+                yield {
+                    'source': filename,
+                    'page': page_num,
+                    'text': text[start:end],
+                    'topics': topics
+                }
+    
+    def _question_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Split page text into questions, yielding each one's (start, end) offsets as soon as it ends."""
+        # Each question runs from a line starting with a question number up to
+        # the next such line, so slice the page text between those positions
+        start = None
+        for match in _QUESTION_START_RE.finditer(text):
+            if start is not None:
+                # Leave out the newline that ends the question's last line
+                yield start, match.start() - 1
+            start = match.start()
+        
+        if start is not None:
+            yield start, len(text)
+    
+    def _identify_topics(self, question_text: str, is_lowercase: bool = False) -> Tuple[str, ...]:
+        """
+        Identify which topics/chapters a question relates to based on keywords.
         
-        print(f"Scanning {len(self.test_banks)} available test banks...")
+        Returns the topics in chapter order as a tuple shared by every question
+        with the same set of topics. Pass is_lowercase=True if question_text is
+        already lowercased to skip lowercasing it again.
+        """
+        if _MATCHER_WANTS_LOWERCASE and not is_lowercase:
+            question_text = question_text.lower()
         
+        found = frozenset(_KEYWORD_MATCHER(question_text))
+        topics = _TOPIC_TUPLES.get(found)
+        if topics is None:
+            topics = _TOPIC_TUPLES[found] = tuple(sorted(found, key=int))
+        return topics
+    
+    def load_all(self):
+        """Extract every test bank once and index question positions by topic."""
+        logger.info("Scanning %d available test banks...", len(self.test_banks))
+        self._extract_in_parallel(self.test_banks)
+        
+        # Collect results in file order; parsed test banks now come from the cache
+        all_questions = []
         for tb_file in self.test_banks:
-            print(f"  Reading {tb_file}...")
             questions = self.extract_questions_from_pdf(tb_file)
+            logger.info("  %s: %d questions", tb_file, len(questions))
             all_questions.extend(questions)
         
-        print(f"Total questions extracted: {len(all_questions)}")
+        logger.info("Total questions extracted: %d", len(all_questions))
         
-        # Filter questions that match any of the selected topics
+        # Question positions per topic, each list in extraction order
+        topic_index = defaultdict(list)
+        for i, question in enumerate(all_questions):
+            for topic in question['topics']:
+                topic_index[topic].append(i)
+        
+        self._all_questions = all_questions
+        self._topic_index = dict(topic_index)
+    
+    def _find_first_questions(self, selected_topics: List[str], max_questions: int) -> List[Dict]:
+        """Collect the first matching questions, stopping as soon as there are enough."""
+        selected = set(selected_topics)
         matching_questions = []
-        for question in all_questions:
-            if any(topic in question['topics'] for topic in selected_topics):
-                matching_questions.append(question)
         
-        print(f"Questions matching selected chapters: {len(matching_questions)}")
+        logger.info("Scanning %d available test banks...", len(self.test_banks))
         
-        # Limit to max_questions if specified
-        if max_questions and max_questions > 0:
-            matching_questions = matching_questions[:max_questions]
+        for tb_file in self.test_banks:
+            logger.info("  Reading %s...", tb_file)
+            for question in self._iter_questions(tb_file):
+                if not selected.isdisjoint(question['topics']):
+                    matching_questions.append(question)
+                    if len(matching_questions) >= max_questions:
+                        return matching_questions
         
         return matching_questions
+    
+    def get_questions_by_topics(self, selected_topics: List[str], max_questions: int = None) -> List[Dict]:
+        """Get questions that match the selected topics."""
+        if self._all_questions is None:
+            # Questions are only ever tagged with TOPIC_KEYWORDS topics, so
+            # nothing can match without one of them and no PDF needs reading
+            if TOPIC_KEYWORDS.keys().isdisjoint(selected_topics):
+                return []
+            
+            # Only read as many test banks as needed to fill a limited request
+            if max_questions and max_questions > 0:
+                return self._find_first_questions(selected_topics, max_questions)
+            self.load_all()
+        
+        # Union the index entries of the selected topics
+        postings = [self._topic_index.get(topic, ()) for topic in selected_topics]
+        ids = postings[0] if len(postings) == 1 else set().union(*postings)
+        
+        logger.info("Questions matching selected chapters: %d", len(ids))
+        
+        # Keep extraction order, limited to max_questions if specified
+        if max_questions and max_questions > 0:
+            ids = heapq.nsmallest(max_questions, ids)
+        else:
+            ids = sorted(ids)
+        
+        return [self._all_questions[i] for i in ids]
+
+
+def _extract_test_bank(pdf_dir: str, filename: str) -> Tuple[str, Optional[List[Dict]]]:
+    """
+    Extract one test bank in a worker process, returning (filename, questions).
+    
+    questions is None if the file couldn't be read completely, so the parent
+    doesn't cache the questions read before the error.
+    """
+    extractor = QuestionExtractor(pdf_dir)
+    questions = extractor.extract_questions_from_pdf(filename)
+    
+    # _iter_questions only caches a file it read to the end
+    try:
+        key = extractor._cache_key(os.path.join(pdf_dir, filename))
+    except FileNotFoundError:
+        return filename, None
+    return filename, questions if key in extractor._pdf_cache else None
 
 
 def display_menu():
@@ -142,14 +498,12 @@ def select_course():
 
 def display_chapters(course: str):
     """Display available chapters for the course."""
-    chapters = AP_CALCULUS_AB_CHAPTERS.copy()
-    if course == "BC":
-        chapters.update(AP_CALCULUS_BC_ADDITIONAL)
+    chapters = COURSE_CHAPTERS[course]
     
     print(f"\nAvailable Chapters for AP Calculus {course}:")
     print("-" * 80)
-    for chapter_num in sorted(chapters.keys(), key=int):
-        print(f"  {chapter_num}. {chapters[chapter_num]}")
+    for chapter_num, chapter_name in chapters.items():
+        print(f"  {chapter_num}. {chapter_name}")
     
     return chapters
 
@@ -163,37 +517,34 @@ def select_chapters(chapters: Dict[str, str]) -> List[str]:
     while True:
         selection = input("\nYour selection: ").strip()
         
-        try:
-            selected = []
-            
-            # Handle ranges and individual numbers
-            parts = selection.split(',')
-            for part in parts:
-                part = part.strip()
-                if '-' in part:
-                    # Range
-                    start, end = part.split('-')
-                    start, end = int(start.strip()), int(end.strip())
-                    selected.extend([str(i) for i in range(start, end + 1)])
-                else:
-                    # Individual number
-                    selected.append(part)
-            
-            # Validate selections
-            valid_selections = []
-            for s in selected:
-                if s in chapters:
-                    valid_selections.append(s)
-                else:
-                    print(f"Warning: Chapter {s} is not valid and will be ignored.")
-            
-            if valid_selections:
-                return valid_selections
+        if not _SELECTION_RE.fullmatch(selection):
+            print("Invalid input format: use chapter numbers and ranges separated by commas, "
+                  "e.g. 1,3 or 1-4. Please try again.")
+            continue
+        
+        # Handle ranges and individual numbers
+        selected = []
+        for match in _SELECTION_PART_RE.finditer(selection):
+            start, end = match.groups()
+            if end is None:
+                # Individual number
+                selected.append(start)
             else:
-                print("No valid chapters selected. Please try again.")
+                # Range
+                selected.extend(str(i) for i in range(int(start), int(end) + 1))
         
-        except Exception as e:
-            print(f"Invalid input format: {e}. Please try again.")
+        # Validate selections
+        valid_selections = []
+        for s in selected:
+            if s in chapters:
+                valid_selections.append(s)
+            else:
+                print(f"Warning: Chapter {s} is not valid and will be ignored.")
+        
+        if valid_selections:
+            return valid_selections
+        else:
+            print("No valid chapters selected. Please try again.")
 
 
 def get_question_count():
@@ -231,10 +582,11 @@ def display_results(questions: List[Dict]):
         print(f"Topics: {', '.join(['Chapter ' + t for t in question['topics']])}")
         print("-" * 80)
         
-        # Display question text (truncate if too long)
+        # Display question text (truncate if too long), without building a
+        # second copy of the truncated text just to append "..."
         text = question['text']
         if len(text) > 800:
-            print(text[:800] + "...")
+            print(text[:800], end="...\n")
         else:
             print(text)
     
@@ -247,19 +599,19 @@ def save_results(questions: List[Dict], filename: str = "selected_questions.txt"
         print("No questions to save.")
         return
     
+    # Build the whole file in memory and write it with a single call
+    parts = ["=" * 80 + "\n", "AP CALCULUS SELECTED QUESTIONS\n", "=" * 80 + "\n\n"]
+    for i, question in enumerate(questions, 1):
+        parts.append(f"\nQuestion {i}:\n")
+        parts.append(f"Source: {question['source']}, Page {question['page']}\n")
+        parts.append(f"Topics: {', '.join(['Chapter ' + t for t in question['topics']])}\n")
+        parts.append("-" * 80 + "\n")
+        parts.append(question['text'])
+        parts.append("\n" + "=" * 80 + "\n")
+    
     try:
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("AP CALCULUS SELECTED QUESTIONS\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for i, question in enumerate(questions, 1):
-                f.write(f"\nQuestion {i}:\n")
-                f.write(f"Source: {question['source']}, Page {question['page']}\n")
-                f.write(f"Topics: {', '.join(['Chapter ' + t for t in question['topics']])}\n")
-                f.write("-" * 80 + "\n")
-                f.write(question['text'])
-                f.write("\n" + "=" * 80 + "\n")
+            f.write(''.join(parts))
         
         print(f"\nResults saved to {filename}")
     except Exception as e:
@@ -268,6 +620,14 @@ def save_results(questions: List[Dict], filename: str = "selected_questions.txt"
 
 def main():
     """Main entry point for the CLI application."""
+    parser = argparse.ArgumentParser(
+        description="Select AP Calculus test bank questions by College Board chapter."
+    )
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="show progress while the test banks are read")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+    
     display_menu()
     
     # Select course